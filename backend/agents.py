@@ -8,6 +8,10 @@ from openai import OpenAI
 
 from core.exceptions import GenerationCancelled
 
+_JAVA_CODE_BLOCK_RE = re.compile(r'```java(.*)```', re.DOTALL)
+_CODE_BLOCK_RE = re.compile(r'```(.*)```', re.DOTALL)
+_CONTEXT_BLOCK_RE = re.compile(r'```(.+?)```', re.DOTALL)
+
 
 class Agent:
     def __init__(self, llm_name: str):
@@ -189,7 +193,7 @@ class Agent:
                 # the input is too long
                 if 'Please reduce the length' in str(e):
                     context_part = messages[0]['content'].split('(with some details omitted):')[1]
-                    context_part = re.findall(r'```(.+?)```', context_part, re.DOTALL)[0]
+                    context_part = _CONTEXT_BLOCK_RE.findall(context_part)[0]
                     assert len(context_part) > 0
                     # get the idx of the line whose length is the largest among all lines. can use argmax?
                     context_lines = context_part.split('\n')
@@ -238,9 +242,9 @@ class Agent:
         return answer
     
     def extract_code_from_response(self, response: str):
-        code = re.findall(r'```java(.*)```', response, re.DOTALL)
+        code = _JAVA_CODE_BLOCK_RE.findall(response)
         if len(code) == 0:
-            code = re.findall(r'```(.*)```', response, re.DOTALL)
+            code = _CODE_BLOCK_RE.findall(response)
             if len(code) == 0:
                 print(f"[Warning] The response does not contain any code: {response}")
                 return " "  # TODO: refine this process
@@ -258,15 +262,8 @@ class Agent:
         return '\n'.join(lines)
     
     def remove_line_numbers(self, content):
-        lines = content.split('\n')
-        removed_lines = []
-        for line in lines:
-            removed_lines.append(self.remove_single_line_number(line))
-        return '\n'.join(removed_lines)
-    
-    def remove_single_line_number(self, line):
-        marker_index = line.find(':')
-        return line[marker_index+1:]
+        # keep everything after the first ':' on each line
+        return '\n'.join([line[line.find(':')+1:] for line in content.split('\n')])
 
 
 class TestDescAgent(Agent):
@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 import socketserver
 import threading
 from http.server import BaseHTTPRequestHandler
@@ -40,6 +41,7 @@ class ResponseStream:
 
     def __call__(self, data: bytes) -> None:
         with self._lock:
+            # 数据与换行符合并为一次 write，避免换行符单独触发一次写入
             self._handler.wfile.write(data + b"\n")
             self._handler.wfile.flush()
 
@@ -66,17 +68,15 @@ def validate_query_payload(payload: Dict[str, Any]) -> Tuple[str, Dict[str, Any]
     data = payload.get("data")
     if not isinstance(data, dict):
         raise ValueError("Query data must be a JSON object")
-    missing = [field for field in ModelQuerySession.required_fields if field not in data]
+    missing = ModelQuerySession.required_fields.difference(data)
     if missing:
-        raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        raise ValueError(f"Missing required fields: {', '.join(sorted(missing))}")
     session_id = payload.get("session_id") or payload.get("id") or _generate_session_id()
     return session_id, data
 
 
 def _generate_session_id() -> str:
-    import uuid
-
-    return uuid.uuid4().hex
+    return os.urandom(16).hex()
 
 
 class QueryHandler(BaseHTTPRequestHandler):
@@ -1,30 +1,28 @@
 from __future__ import annotations
 
-import threading
 from typing import Dict, Iterable, Optional
 
 from .session import ModelQuerySession
 
 
 class SessionRegistry:
-    """线程安全的会话注册表。"""
+    """线程安全的会话注册表。
+
+    单键的 dict 读写/删除以及 ``tuple(dict)`` 快照在 CPython 中均由 GIL 保证原子性，
+    因此无需额外加锁，避免所有会话争用同一把全局锁。
+    """
 
     def __init__(self) -> None:
         self._sessions: Dict[str, ModelQuerySession] = {}
-        self._lock = threading.Lock()
 
     def register(self, session: ModelQuerySession) -> None:
-        with self._lock:
-            self._sessions[session.session_id] = session
+        self._sessions[session.session_id] = session
 
     def remove(self, session_id: str) -> None:
-        with self._lock:
-            self._sessions.pop(session_id, None)
+        self._sessions.pop(session_id, None)
 
     def get(self, session_id: str) -> Optional[ModelQuerySession]:
-        with self._lock:
-            return self._sessions.get(session_id)
+        return self._sessions.get(session_id)
 
     def list_active_ids(self) -> Iterable[str]:
-        with self._lock:
-            return tuple(self._sessions.keys())
+        return tuple(self._sessions)
@@ -16,13 +16,27 @@ QueryExecutor = Callable[[Dict[str, Any], "ModelQuerySession"], None]
 class ModelQuerySession:
     """封装单次生成流程的上下文与与客户端通信能力。"""
 
-    required_fields = [
-        "target_focal_method",
-        "target_focal_file",
-        "test_desc",
-        "project_path",
-        "focal_file_path",
-    ]
+    __slots__ = (
+        "session_id",
+        "raw_data",
+        "_writer",
+        "_executor",
+        "junit_version",
+        "messages",
+        "query_data",
+        "_session_running",
+        "_cancel_event",
+    )
+
+    required_fields = frozenset(
+        {
+            "target_focal_method",
+            "target_focal_file",
+            "test_desc",
+            "project_path",
+            "focal_file_path",
+        }
+    )
 
     def __init__(
         self,
@@ -2,9 +2,54 @@ import json
 import os
 import re
 from collections import namedtuple
+from functools import lru_cache
 CoveragePair = namedtuple('CoveragePair', ['project_name', 'focal_file_path', 'focal_method_name', 'coverage', 'focal_method', 'context', 'focal_file_skeleton', 'test_case', 'test_case_name', 'test_case_path', 'references'])
 
 
+_DESC_SECTIONS = ('Objective', 'Preconditions', 'Expected Results')
+
+
+@lru_cache(maxsize=1024)
+def _divide_desc(desc):
+    """Parse a test description into ((objective, preconditions, expected results), divided_lines).
+
+    The same description is typically re-parsed across generation rounds, so the
+    result is cached; it is returned as tuples to stay immutable between callers.
+    divided_lines holds the section body lines when the line count check fails
+    (None otherwise), so the caller can report the mismatch on every call.
+    """
+    desc_lines = desc.split('\n')
+    obj_line_idx, precondictions_line_idx, expected_results_line_idx = None, None, None
+    for line_idx, each_line in enumerate(desc_lines):
+        if each_line.strip().startswith('#'):
+            if '# Obj' in each_line:
+                obj_line_idx = line_idx
+            elif '# Precondition' in each_line:
+                precondictions_line_idx = line_idx
+            elif '# Expected' in each_line:
+                expected_results_line_idx = line_idx
+            else:
+                raise ValueError(f'Unknown desc line: {each_line}')
+    assert None not in (obj_line_idx, precondictions_line_idx, expected_results_line_idx), f'Incompleted Test Desc:\n{desc}\n\n'
+    assert obj_line_idx < precondictions_line_idx < expected_results_line_idx, f'Invalid order of desc:\n{desc}\n\n'
+    obj = desc_lines[obj_line_idx+1:precondictions_line_idx]
+    precondictions = desc_lines[precondictions_line_idx+1:expected_results_line_idx]
+    expected_results = desc_lines[expected_results_line_idx+1:]
+
+    # Check the total number of lines
+    divided_lines = obj + precondictions + expected_results
+    total_lines_origin = len([each_line for each_line in desc_lines if each_line.strip()])
+    total_lines_divided = len([each_line for each_line in divided_lines if each_line.strip()]) + 3
+    mismatched_lines = tuple(divided_lines) if total_lines_origin != total_lines_divided else None
+
+    sections = (
+        '\n'.join(obj).strip(),
+        '\n'.join(precondictions).strip(),
+        '\n'.join(expected_results).strip(),
+    )
+    return sections, mismatched_lines
+
+
 class Dataset:
     def __init__(self, configs):
         self.configs = configs
@@ -133,37 +178,10 @@ class Dataset:
             1. The `parse` method throws an `IllegalArgumentException` with the message "Empty expression!".
         need to divide it into Objective, Preconditions, Expected Results
         """
-        desc_lines = desc.split('\n')
-        obj_line_idx, precondictions_line_idx, expected_results_line_idx = None, None, None
-        for line_idx, each_line in enumerate(desc_lines):
-            if each_line.strip().startswith('#'):
-                if '# Obj' in each_line:
-                    obj_line_idx = line_idx
-                elif '# Precondition' in each_line:
-                    precondictions_line_idx = line_idx
-                elif '# Expected' in each_line:
-                    expected_results_line_idx = line_idx
-                else:
-                    raise ValueError(f'Unknown desc line: {each_line}')
-        assert None not in (obj_line_idx, precondictions_line_idx, expected_results_line_idx), f'Incompleted Test Desc:\n{desc}\n\n'
-        assert obj_line_idx < precondictions_line_idx < expected_results_line_idx, f'Invalid order of desc:\n{desc}\n\n'
-        obj = desc_lines[obj_line_idx+1:precondictions_line_idx]
-        precondictions = desc_lines[precondictions_line_idx+1:expected_results_line_idx]
-        expected_results = desc_lines[expected_results_line_idx+1:]
-
-        desc_dict = {
-            'Objective': '\n'.join(obj).strip(),
-            'Preconditions': '\n'.join(precondictions).strip(),
-            'Expected Results': '\n'.join(expected_results).strip()
-        }
-
-        # Check the total number of lines
-        total_lines_origin = len([each_line for each_line in desc_lines if each_line.strip()])
-        total_lines_divided = len([each_line for each_line in obj + precondictions + expected_results if each_line.strip()]) + 3
-        if total_lines_origin != total_lines_divided:
-            print(f'WARNING: The total number of lines is not equal after dividing the desc.\nOriginal:\n{desc}\n--------------------\nDivided three parts\n{obj + precondictions + expected_results}\n\n')
-
-        return desc_dict
+        sections, mismatched_lines = _divide_desc(desc)
+        if mismatched_lines is not None:
+            print(f'WARNING: The total number of lines is not equal after dividing the desc.\nOriginal:\n{desc}\n--------------------\nDivided three parts\n{list(mismatched_lines)}\n\n')
+        return dict(zip(_DESC_SECTIONS, sections))
         
     def load_offline_fact_ref_data(self, reference_setting = 'retrieve', fact_setting = 'disc', test_desc_setting = 'full', max_exploration_depth = 5, retrieval_threshold = 0.2):
         save_path = f'{self.configs.fact_set_dir}/ref_{reference_setting}_fact_{fact_setting}_desc_{test_desc_setting}_depth_{max_exploration_depth}_refThres_{retrieval_threshold}.json'
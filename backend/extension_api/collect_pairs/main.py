@@ -144,7 +144,7 @@ def dump_collect_pairs(project_path):
     all_data = collect_pairs(project_path.as_posix(), False)
     assert len(all_data) > 0
     with open((save_dir / f'{project_name}.json').as_posix(), 'w') as f:
-        json.dump(all_data, f, indent=4)
+        f.write(json.dumps(all_data, indent=4))
 
 
 if __name__ == "__main__":
@@ -35,7 +35,7 @@ class IntentionTester:
             self.query_session.update_messages(messages)
 
     def _ensure_not_cancelled(self):
-        if self.query_session and self.query_session.should_stop():
+        if self._cancel_check():
             raise GenerationCancelled()
 
     def generate_test_case_with_refine(self, 
@@ -151,8 +151,12 @@ class IntentionTester:
         return error_msg, test_status
 
     def _apply_cancel_hook(self):
-        def cancel_check() -> bool:
-            return bool(self.query_session and self.query_session.should_stop())
+        # Bind the session's should_stop directly; re-applied whenever query_session changes.
+        if self.query_session:
+            cancel_check = self.query_session.should_stop
+        else:
+            def cancel_check() -> bool:
+                return False
 
         self._cancel_check = cancel_check
         self.test_gen_agent.set_cancel_check(cancel_check)
@@ -98,7 +98,7 @@ class TestCaseRunner():
     def save_log_coverage(self, log_coverage, save_path):
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
         with open(save_path, 'w', encoding='utf8') as f:
-            json.dump(log_coverage, f, indent=4)
+            f.write(json.dumps(log_coverage, indent=4))
             logger.debug(f'Saved the generated test cases log and coverage to {save_path}')
 
     def run_test_case(self, test_case_path, focal_file_path, is_ref):
@@ -3,6 +3,8 @@ Pytest configuration and fixtures for backend tests.
 """
 import os
 import sys
+from types import SimpleNamespace
+
 import pytest
 
 # Add backend directory to Python path for imports
@@ -15,3 +17,11 @@ def setup_env():
     os.environ.setdefault('OPEN_AI_KEY', 'test-api-key')
     os.environ.setdefault('OPENAI_BASE_URL', 'https://api.test.openai.com/v1')
     yield
+
+
+@pytest.fixture
+def fake_completion():
+    """构造轻量的 chat completion 响应，替代多层 MagicMock"""
+    def _build(content):
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+    return _build
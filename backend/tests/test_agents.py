@@ -251,8 +251,8 @@ class TestAgentCheckCancel:
         agent._check_cancel()
 
 
-class TestAgentRemoveSingleLineNumber:
-    """Test Agent.remove_single_line_number method."""
+class TestAgentRemoveLineNumbersSingleLine:
+    """Test Agent.remove_line_numbers on single lines."""
 
     def test_removes_line_number(self):
         """Test removing a single line number."""
@@ -260,7 +260,7 @@ class TestAgentRemoveSingleLineNumber:
 
         agent = Agent.__new__(Agent)
         line = "42:     def foo():"
-        result = agent.remove_single_line_number(line)
+        result = agent.remove_line_numbers(line)
 
         # Method returns everything after the first colon
         assert result == "     def foo():"
@@ -271,6 +271,6 @@ class TestAgentRemoveSingleLineNumber:
 
         agent = Agent.__new__(Agent)
         line = "10: return {'key': 'value'}"
-        result = agent.remove_single_line_number(line)
+        result = agent.remove_line_numbers(line)
 
         assert result == " return {'key': 'value'}"
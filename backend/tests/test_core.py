@@ -1,19 +1,35 @@
 """
 Tests for core/registry.py and core/session.py.
 """
+import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import pytest
+
+from core.registry import SessionRegistry
+from core.session import ModelQuerySession
+
+
+@pytest.fixture
+def raw_data():
+    """A query payload containing every required session field."""
+    return {
+        "target_focal_method": "test",
+        "target_focal_file": "Test.java",
+        "test_desc": "desc",
+        "project_path": "/path",
+        "focal_file_path": "/path/Test.java",
+    }
+
 
 class TestSessionRegistry:
     """Test the SessionRegistry thread-safe session management."""
 
     def test_register_and_get(self):
         """Test registering and retrieving a session."""
-        from core.registry import SessionRegistry
-
         registry = SessionRegistry()
-        mock_session = MagicMock()
-        mock_session.session_id = "test-123"
+        mock_session = SimpleNamespace(session_id="test-123")
 
         registry.register(mock_session)
         result = registry.get("test-123")
@@ -22,8 +38,6 @@ class TestSessionRegistry:
 
     def test_get_nonexistent_returns_none(self):
         """Test getting a non-existent session returns None."""
-        from core.registry import SessionRegistry
-
         registry = SessionRegistry()
         result = registry.get("nonexistent")
 
@@ -31,11 +45,8 @@ class TestSessionRegistry:
 
     def test_remove_session(self):
         """Test removing a session."""
-        from core.registry import SessionRegistry
-
         registry = SessionRegistry()
-        mock_session = MagicMock()
-        mock_session.session_id = "test-456"
+        mock_session = SimpleNamespace(session_id="test-456")
 
         registry.register(mock_session)
         registry.remove("test-456")
@@ -45,13 +56,9 @@ class TestSessionRegistry:
 
     def test_list_active_ids(self):
         """Test listing all active session IDs."""
-        from core.registry import SessionRegistry
-
         registry = SessionRegistry()
         for i in range(3):
-            mock = MagicMock()
-            mock.session_id = f"session-{i}"
-            registry.register(mock)
+            registry.register(SimpleNamespace(session_id=f"session-{i}"))
 
         ids = registry.list_active_ids()
 
@@ -62,8 +69,6 @@ class TestSessionRegistry:
 
     def test_remove_nonexistent_does_not_raise(self):
         """Test removing a non-existent session doesn't raise."""
-        from core.registry import SessionRegistry
-
         registry = SessionRegistry()
         # Should not raise
         registry.remove("nonexistent")
@@ -74,25 +79,14 @@ class TestModelQuerySession:
 
     def test_required_fields(self):
         """Test that required_fields is defined correctly."""
-        from core.session import ModelQuerySession
-
         assert "target_focal_method" in ModelQuerySession.required_fields
         assert "test_desc" in ModelQuerySession.required_fields
         assert len(ModelQuerySession.required_fields) == 5
 
-    def test_request_stop_and_should_stop(self):
+    def test_request_stop_and_should_stop(self, raw_data):
         """Test the cancellation mechanism."""
-        from core.session import ModelQuerySession
-
         writer = MagicMock()
         executor = MagicMock()
-        raw_data = {
-            "target_focal_method": "test",
-            "target_focal_file": "Test.java",
-            "test_desc": "desc",
-            "project_path": "/path",
-            "focal_file_path": "/path/Test.java",
-        }
 
         session = ModelQuerySession(
             session_id="sess-1",
@@ -106,24 +100,13 @@ class TestModelQuerySession:
         session.request_stop()
         assert session.should_stop() is True
 
-    def test_write_start_message(self):
+    def test_write_start_message(self, raw_data):
         """Test writing start message."""
-        from core.session import ModelQuerySession
-        import json
-
         captured = []
 
         def writer(data):
             captured.append(data)
 
-        raw_data = {
-            "target_focal_method": "test",
-            "target_focal_file": "Test.java",
-            "test_desc": "desc",
-            "project_path": "/path",
-            "focal_file_path": "/path/Test.java",
-        }
-
         session = ModelQuerySession(
             session_id="sess-2",
             raw_data=raw_data,
@@ -135,28 +118,17 @@ class TestModelQuerySession:
         session.write_start_message()
 
         assert len(captured) == 1
-        parsed = json.loads(captured[0].decode())
+        parsed = json.loads(captured[0])
         assert parsed["type"] == "status"
         assert parsed["data"]["status"] == "start"
 
-    def test_write_finish_message(self):
+    def test_write_finish_message(self, raw_data):
         """Test writing finish message."""
-        from core.session import ModelQuerySession
-        import json
-
         captured = []
 
         def writer(data):
             captured.append(data)
 
-        raw_data = {
-            "target_focal_method": "test",
-            "target_focal_file": "Test.java",
-            "test_desc": "desc",
-            "project_path": "/path",
-            "focal_file_path": "/path/Test.java",
-        }
-
         session = ModelQuerySession(
             session_id="sess-3",
             raw_data=raw_data,
@@ -168,27 +140,16 @@ class TestModelQuerySession:
         session.write_finish_message()
 
         assert len(captured) == 1
-        parsed = json.loads(captured[0].decode())
+        parsed = json.loads(captured[0])
         assert parsed["data"]["status"] == "finish"
 
-    def test_update_messages(self):
+    def test_update_messages(self, raw_data):
         """Test updating and sending messages."""
-        from core.session import ModelQuerySession
-        import json
-
         captured = []
 
         def writer(data):
             captured.append(data)
 
-        raw_data = {
-            "target_focal_method": "test",
-            "target_focal_file": "Test.java",
-            "test_desc": "desc",
-            "project_path": "/path",
-            "focal_file_path": "/path/Test.java",
-        }
-
         session = ModelQuerySession(
             session_id="sess-4",
             raw_data=raw_data,
@@ -202,5 +163,5 @@ class TestModelQuerySession:
 
         assert session.messages == messages
         assert len(captured) == 1
-        parsed = json.loads(captured[0].decode())
+        parsed = json.loads(captured[0])
         assert parsed["type"] == "msg"
@@ -1,6 +1,11 @@
 """
 Tests for dataset.py utility methods.
 """
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataset import Dataset
 
 
 class TestDatasetDivideDesc:
@@ -8,9 +13,6 @@ class TestDatasetDivideDesc:
 
     def test_divide_desc_full_format(self):
         """Test parsing a complete description with all sections."""
-        from unittest.mock import MagicMock
-        from dataset import Dataset
-
         # Create a mock dataset
         dataset = Dataset.__new__(Dataset)
         dataset.configs = MagicMock()
@@ -32,10 +34,6 @@ Verify the parse method works correctly.
 
     def test_divide_desc_missing_section_raises(self):
         """Test that missing sections raise AssertionError."""
-        import pytest
-        from unittest.mock import MagicMock
-        from dataset import Dataset
-
         dataset = Dataset.__new__(Dataset)
         dataset.configs = MagicMock()
 
@@ -49,15 +47,57 @@ It should work."""
         with pytest.raises(AssertionError):
             dataset.divide_desc(desc)
 
+    def test_divide_desc_repeated_calls_return_independent_dicts(self):
+        """Test that cached parsing does not leak mutations between calls."""
+        dataset = Dataset.__new__(Dataset)
+        dataset.configs = MagicMock()
+
+        desc = """# Objective
+Check caching.
+
+# Preconditions
+1. Nothing.
+
+# Expected Results
+1. Same result."""
+
+        first = dataset.divide_desc(desc)
+        first['under_setting'] = 'mutated'
+        second = dataset.divide_desc(desc)
+
+        assert second == {
+            "Objective": "Check caching.",
+            "Preconditions": "1. Nothing.",
+            "Expected Results": "1. Same result.",
+        }
+
+
+    def test_divide_desc_warns_on_every_call(self, capsys):
+        """Test that the line-count warning is not swallowed by caching."""
+        dataset = Dataset.__new__(Dataset)
+        dataset.configs = MagicMock()
+
+        desc = """Stray preamble line.
+# Objective
+Check warnings.
+
+# Preconditions
+1. Nothing.
+
+# Expected Results
+1. Warned twice."""
+
+        for _ in range(2):
+            dataset.divide_desc(desc)
+
+        assert capsys.readouterr().out.count("WARNING: The total number of lines") == 2
+
 
 class TestDatasetAddNewlineChar:
     """Test the add_newline_char utility method."""
 
     def test_add_newline_to_string(self):
         """Test adding newline characters."""
-        from unittest.mock import MagicMock
-        from dataset import Dataset
-
         dataset = Dataset.__new__(Dataset)
         dataset.configs = MagicMock()
 
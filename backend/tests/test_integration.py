@@ -7,6 +7,15 @@ generation flow without making actual API calls.
 import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+import agents
+from agents import Agent
+from app.server import validate_query_payload
+from core.registry import SessionRegistry
+from core.session import ModelQuerySession
+from dataset import Dataset
+
 
 class TestGenerationWorkflow:
     """Test the complete test generation workflow with mocked API."""
@@ -17,8 +26,6 @@ class TestGenerationWorkflow:
             mock_client = MagicMock()
             mock_openai.return_value = mock_client
 
-            from agents import Agent
-
             # Create agent with mocked client
             agent = Agent.__new__(Agent)
             agent.client = mock_client
@@ -30,8 +37,6 @@ class TestGenerationWorkflow:
     def test_extract_code_integration(self):
         """Test code extraction from a realistic API response."""
         with patch('agents.OpenAI'):
-            from agents import Agent
-
             agent = Agent.__new__(Agent)
 
             # Simulate realistic API response
@@ -67,8 +72,6 @@ This test covers the basic arithmetic operations.'''
     def test_remove_thinking_integration(self):
         """Test thinking tag removal from DeepSeek-style responses."""
         with patch('agents.OpenAI'):
-            from agents import Agent
-
             agent = Agent.__new__(Agent)
 
             response = '''<think>
@@ -97,20 +100,14 @@ public class MyTest {
 class TestMockedAPIFlow:
     """Test complete API flow with mocked responses."""
 
-    def test_chat_completion_mock(self):
+    def test_chat_completion_mock(self, fake_completion):
         """Test that chat completion can be mocked properly."""
         with patch('agents.OpenAI') as mock_openai:
             # Setup mock
             mock_client = MagicMock()
-            mock_completion = MagicMock()
-            mock_message = MagicMock()
-            mock_message.content = '```java\npublic class Test {}\n```'
-            mock_completion.choices = [MagicMock(message=mock_message)]
-            mock_client.chat.completions.create.return_value = mock_completion
+            mock_client.chat.completions.create.return_value = fake_completion('```java\npublic class Test {}\n```')
             mock_openai.return_value = mock_client
 
-            from agents import Agent
-
             # Verify mock setup
             client = mock_openai()
             response = client.chat.completions.create(
@@ -126,10 +123,6 @@ class TestSessionLifecycle:
 
     def test_session_creation_and_registration(self):
         """Test creating a session and registering it."""
-        from core.registry import SessionRegistry
-        from core.session import ModelQuerySession
-        from unittest.mock import MagicMock
-
         registry = SessionRegistry()
 
         # Create session with all required args mocked
@@ -159,9 +152,6 @@ class TestSessionLifecycle:
 
     def test_session_stop_mechanism(self):
         """Test session stop mechanism."""
-        from core.session import ModelQuerySession
-        from unittest.mock import MagicMock
-
         # Create session with all required args
         session = ModelQuerySession(
             session_id="stop-test",
@@ -188,10 +178,6 @@ class TestSessionLifecycle:
 
     def test_registry_list_active_ids(self):
         """Test listing active session IDs."""
-        from core.registry import SessionRegistry
-        from core.session import ModelQuerySession
-        from unittest.mock import MagicMock
-
         registry = SessionRegistry()
 
         # Initially empty
@@ -227,8 +213,6 @@ class TestRequestValidationFlow:
 
     def test_valid_query_payload_flow(self):
         """Test complete validation of a valid query payload."""
-        from app.server import validate_query_payload
-
         payload = {
             "type": "query",
             "session_id": "valid-session",
@@ -248,9 +232,6 @@ class TestRequestValidationFlow:
 
     def test_invalid_payload_flow(self):
         """Test validation rejects invalid payloads."""
-        import pytest
-        from app.server import validate_query_payload
-
         # Missing required fields
         payload = {
             "type": "query",
@@ -266,8 +247,6 @@ class TestDatasetProcessingFlow:
 
     def test_description_parsing_flow(self):
         """Test complete description parsing flow."""
-        from dataset import Dataset
-
         dataset = Dataset.__new__(Dataset)
         dataset.configs = type('obj', (object,), {'project_name': 'test'})()
 
@@ -294,9 +273,7 @@ class TestEndToEndCodeExtraction:
     def test_multiblock_code_extraction(self):
         """Test extracting code when multiple blocks exist."""
         with patch('agents.OpenAI'):
-            from agents import TestGenAgent
-
-            agent = TestGenAgent.__new__(TestGenAgent)
+            agent = agents.TestGenAgent.__new__(agents.TestGenAgent)
 
             response = '''I'll provide two test methods:
 
@@ -323,8 +300,6 @@ public void testNegative() {
     def test_code_with_line_numbers(self):
         """Test processing code that has line numbers."""
         with patch('agents.OpenAI'):
-            from agents import Agent
-
             agent = Agent.__new__(Agent)
 
             code_with_numbers = """1: public class Test {
@@ -1,16 +1,18 @@
 """
 Tests for app/server.py utility functions.
 """
+from types import SimpleNamespace
+
 import pytest
 
+from app.server import ResponseStream, _generate_session_id, validate_query_payload
+
 
 class TestValidateQueryPayload:
     """Test the validate_query_payload function."""
 
     def test_valid_payload(self):
         """Test a valid query payload."""
-        from app.server import validate_query_payload
-
         payload = {
             "type": "query",
             "session_id": "test-session",
@@ -30,8 +32,6 @@ class TestValidateQueryPayload:
 
     def test_invalid_type_raises(self):
         """Test that invalid type raises ValueError."""
-        from app.server import validate_query_payload
-
         payload = {"type": "invalid", "data": {}}
 
         with pytest.raises(ValueError, match="Unsupported request type"):
@@ -39,8 +39,6 @@ class TestValidateQueryPayload:
 
     def test_missing_data_raises(self):
         """Test that missing data raises ValueError."""
-        from app.server import validate_query_payload
-
         payload = {"type": "query", "data": "not_a_dict"}
 
         with pytest.raises(ValueError, match="must be a JSON object"):
@@ -48,8 +46,6 @@ class TestValidateQueryPayload:
 
     def test_missing_required_fields_raises(self):
         """Test that missing required fields raises ValueError."""
-        from app.server import validate_query_payload
-
         payload = {
             "type": "query",
             "data": {"target_focal_method": "test"},
@@ -60,8 +56,6 @@ class TestValidateQueryPayload:
 
     def test_generates_session_id_when_missing(self):
         """Test that session_id is generated when not provided."""
-        from app.server import validate_query_payload
-
         payload = {
             "type": "query",
             "data": {
@@ -83,19 +77,14 @@ class TestResponseStream:
     """Test the ResponseStream class."""
 
     def test_call_writes_data(self):
-        """Test that calling the stream writes data."""
-        from app.server import ResponseStream
-        from unittest.mock import MagicMock
-        from io import BytesIO
-
-        handler = MagicMock()
-        handler.wfile = BytesIO()
+        """Test that calling the stream writes data and its newline in one write."""
+        writes = []
+        handler = SimpleNamespace(wfile=SimpleNamespace(write=writes.append, flush=lambda: None))
 
         stream = ResponseStream(handler)
         stream(b"test data")
 
-        handler.wfile.seek(0)
-        assert handler.wfile.read() == b"test data\n"
+        assert writes == [b"test data\n"]
 
 
 class TestGenerateSessionId:
@@ -103,16 +92,12 @@ class TestGenerateSessionId:
 
     def test_generates_unique_ids(self):
         """Test that generated IDs are unique."""
-        from app.server import _generate_session_id
-
         ids = [_generate_session_id() for _ in range(10)]
 
         assert len(set(ids)) == 10  # All unique
 
     def test_generates_hex_string(self):
         """Test that generated ID is a hex string."""
-        from app.server import _generate_session_id
-
         session_id = _generate_session_id()
 
         assert len(session_id) == 32  # UUID hex is 32 chars